@@ -0,0 +1,303 @@
+from collections import deque
+
+# Canonical skill -> surface forms that should count as that skill.
+# Matching is case-insensitive and respects word boundaries.
+# Any alias that is also an everyday word or unit in resume/JD text (react,
+# excel, spring, swift, ruby, rust, spark, go, ml, rag, ...) is only matched
+# through a qualified form such as "reactjs", "ms excel", "spring boot" or
+# "rag pipeline". In particular a bare "Go" is never counted; write "golang"
+# in the JD to require it.
+DEFAULT_SKILLS = {
+    "python": ["python"],
+    "java": ["java"],
+    "javascript": ["javascript", "js", "ecmascript"],
+    "typescript": ["typescript"],
+    "c++": ["c++", "cpp"],
+    "c#": ["c#", "csharp"],
+    "go": ["golang"],
+    "rust": ["rustlang", "rust language", "rust programming"],
+    "scala": ["scala"],
+    "kotlin": ["kotlin"],
+    "swift": ["swiftui", "swift language", "swift programming"],
+    "php": ["php"],
+    "ruby": ["ruby on rails", "ruby programming"],
+    "sql": ["sql"],
+    "nosql": ["nosql"],
+    "postgresql": ["postgresql", "postgres"],
+    "mysql": ["mysql"],
+    "mongodb": ["mongodb", "mongo"],
+    "redis": ["redis"],
+    "html": ["html", "html5"],
+    "css": ["css", "css3"],
+    "react": ["reactjs", "react.js", "react native"],
+    "angular": ["angularjs", "angular.js"],
+    "vue": ["vue", "vuejs", "vue.js"],
+    "node.js": ["node.js", "nodejs", "node js"],
+    ".net": [".net", "dotnet", "asp.net"],
+    "django": ["django"],
+    "flask": ["flask"],
+    "fastapi": ["fastapi"],
+    "spring": ["spring boot", "spring framework", "spring mvc"],
+    "rest api": ["rest api", "restful", "rest apis"],
+    "graphql": ["graphql"],
+    "microservices": ["microservices", "microservice"],
+    "aws": ["aws", "amazon web services"],
+    "azure": ["azure"],
+    "gcp": ["gcp", "google cloud"],
+    "docker": ["docker"],
+    "kubernetes": ["kubernetes", "k8s"],
+    "terraform": ["terraform"],
+    "ci/cd": ["ci/cd", "continuous integration", "jenkins", "github actions"],
+    "git": ["git", "github", "gitlab"],
+    "linux": ["linux", "unix"],
+    "spark": ["apache spark", "pyspark", "spark sql"],
+    "hadoop": ["hadoop"],
+    "kafka": ["kafka"],
+    "airflow": ["airflow"],
+    "etl": ["etl"],
+    "tableau": ["tableau"],
+    "power bi": ["power bi", "powerbi"],
+    "excel": ["ms excel", "microsoft excel", "advanced excel"],
+    "pandas": ["pandas"],
+    "numpy": ["numpy"],
+    "scikit-learn": ["scikit-learn", "sklearn", "scikit learn"],
+    "tensorflow": ["tensorflow"],
+    "pytorch": ["pytorch"],
+    "keras": ["keras"],
+    "machine learning": ["machine learning", "ml engineer", "ml models", "ml engineering"],
+    "deep learning": ["deep learning"],
+    "nlp": ["nlp", "natural language processing"],
+    "computer vision": ["computer vision", "opencv"],
+    "llm": ["llm", "llms", "large language models", "large language model"],
+    "rag": ["rag pipeline", "rag pipelines", "retrieval augmented generation", "retrieval-augmented generation"],
+    "langchain": ["langchain"],
+    "statistics": ["statistics", "statistical"],
+    "data analysis": ["data analysis", "data analytics"],
+    "agile": ["agile", "scrum"],
+}
+
+# Word boundaries: "/" and "." separate words ("python/django",
+# "Java.Spring Boot" from PDF extraction). E-mail addresses and domains are
+# not skill mentions: anything right after "@" and anything followed by a
+# common top-level domain ("java.com", "python.org") is skipped.
+# A trailing version number ("Python3", "java8", "Python3.10") is allowed.
+_DOMAIN_SUFFIXES = ("com", "org", "net", "io", "edu", "gov", "dev", "info")
+
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch == "_"
+
+
+def _glued_before(text, start):
+    if start == 0:
+        return False
+    prev = text[start - 1]
+    if _is_word_char(prev):
+        return True
+    return prev == "@" and start >= 2 and _is_word_char(text[start - 2])
+
+
+def _skip_version(text, i):
+    """Return the index just past a version suffix ("3", "3.10") starting at i."""
+    if i >= len(text) or not text[i].isdigit():
+        return i
+    while i < len(text) and text[i].isdigit():
+        i += 1
+    while i + 1 < len(text) and text[i] == "." and text[i + 1].isdigit():
+        i += 1
+        while i < len(text) and text[i].isdigit():
+            i += 1
+    return i
+
+
+def _glued_after(text, end):
+    i = _skip_version(text, end + 1)
+    if i >= len(text):
+        return False
+    nxt = text[i]
+    if _is_word_char(nxt):
+        return True
+    if nxt == "@":
+        return i + 1 < len(text) and _is_word_char(text[i + 1])
+    if nxt == ".":
+        j = i + 1
+        while j < len(text) and _is_word_char(text[j]):
+            j += 1
+        return text[i + 1:j] in _DOMAIN_SUFFIXES
+    return False
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over a skill vocabulary.
+    Built once, then finds every skill in a text in a single pass.
+    """
+
+    def __init__(self, skills=None):
+        skills = skills if skills is not None else DEFAULT_SKILLS
+        self.skill_names = list(skills)
+        self.skill_ids = {name: i for i, name in enumerate(self.skill_names)}
+
+        # Trie: per-node transition dict, failure link and matched outputs
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+
+        for name, aliases in skills.items():
+            for alias in aliases:
+                self._add(alias.lower(), self.skill_ids[name])
+        self._build_failure_links()
+
+    def _add(self, pattern, skill_id):
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((skill_id, len(pattern)))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._out[child].extend(self._out[self._fail[child]])
+
+    def find_skills(self, text):
+        """Return the set of skill ids mentioned in the text."""
+        if not isinstance(text, str):
+            return set()
+        text = text.lower()
+        goto, fail, out = self._goto, self._fail, self._out
+        found = set()
+        node = 0
+        for end, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for skill_id, length in out[node]:
+                if skill_id in found:
+                    continue
+                start = end - length + 1
+                # Only accept whole-word matches ("java" must not match "javascript").
+                # Aliases ending in punctuation ("c++", "c#") need no right boundary.
+                if _glued_before(text, start):
+                    continue
+                if _is_word_char(text[end]) and _glued_after(text, end):
+                    continue
+                found.add(skill_id)
+        return found
+
+    def skill_mask(self, text):
+        """Return the skills in the text as a bitset (bit i = skill id i)."""
+        mask = 0
+        for skill_id in self.find_skills(text):
+            mask |= 1 << skill_id
+        return mask
+
+    def mask_to_skills(self, mask):
+        return [name for i, name in enumerate(self.skill_names) if mask >> i & 1]
+
+
+class SkillIndex:
+    """
+    Sparse skill vectors for the resume corpus, computed once at ingest.
+    Each resume is stored as a bitset of skills and each skill keeps a bitset
+    of the resumes mentioning it, so JD matching is just AND/popcount over integers.
+    """
+
+    def __init__(self, documents, metadata, matcher=None):
+        self.matcher = matcher or SkillMatcher()
+        self.documents = documents
+        self.metadata = metadata
+        self.filename_to_index = {fname: i for i, fname in enumerate(metadata)}
+
+        self.resume_masks = []
+        # Inverted index: skill id -> bitset of resumes that have it
+        self.skill_postings = [0] * len(self.matcher.skill_names)
+        for doc_idx, doc in enumerate(documents):
+            mask = 0
+            for skill_id in self.matcher.find_skills(doc):
+                mask |= 1 << skill_id
+                self.skill_postings[skill_id] |= 1 << doc_idx
+            self.resume_masks.append(mask)
+
+    def coverage(self, resume_mask, jd_mask):
+        """
+        Return (score 0–100, matched skills, missing skills).
+        The score is None when the JD names no known skills.
+        """
+        if not jd_mask:
+            return None, [], []
+        matched = resume_mask & jd_mask
+        missing = jd_mask & ~resume_mask
+        score = round(matched.bit_count() / jd_mask.bit_count() * 100, 2)
+        return score, self.matcher.mask_to_skills(matched), self.matcher.mask_to_skills(missing)
+
+    def match(self, job_description, filenames=None):
+        """Skill coverage of the given resumes (default: all) against the JD."""
+        jd_mask = self.matcher.skill_mask(job_description)
+        if filenames is None:
+            filenames = self.metadata
+        results = []
+        for fname in filenames:
+            resume_mask = self.resume_masks[self.filename_to_index[fname]]
+            score, matched, missing = self.coverage(resume_mask, jd_mask)
+            results.append({
+                "filename": fname,
+                "skill_score": score,
+                "matched_skills": matched,
+                "missing_skills": missing,
+            })
+        return results
+
+    def search(self, job_description, top_k=5, min_coverage=50.0):
+        """
+        Corpus-wide skill search: the top_k resumes ranked by JD skill coverage,
+        keeping only those covering at least min_coverage percent of the skills.
+        """
+        jd_mask = self.matcher.skill_mask(job_description)
+        if not jd_mask:
+            return []
+
+        # Only resumes sharing at least one JD skill need scoring
+        candidates = 0
+        for skill_id in range(len(self.skill_postings)):
+            if jd_mask >> skill_id & 1:
+                candidates |= self.skill_postings[skill_id]
+
+        required = jd_mask.bit_count()
+        scored = []
+        while candidates:
+            i = (candidates & -candidates).bit_length() - 1
+            candidates &= candidates - 1
+            score = round((self.resume_masks[i] & jd_mask).bit_count() / required * 100, 2)
+            if score >= min_coverage:
+                scored.append((score, i))
+
+        scored.sort(key=lambda x: x[0], reverse=True)
+        return [
+            {"filename": self.metadata[i], "content": self.documents[i], "skill_score": score}
+            for score, i in scored[:top_k]
+        ]
+
+
+def combine_ats_score(semantic_score, skill_score, skill_weight=0.4):
+    """
+    Blend the embedding score with keyword skill coverage (both 0–100).
+    Falls back to the semantic score when there is no skill score.
+    """
+    if skill_score is None:
+        return semantic_score
+    score = (1 - skill_weight) * semantic_score + skill_weight * skill_score
+    return round(score, 2)
@@ -0,0 +1,97 @@
+from app.ats_scorer.skill_matcher import SkillIndex, SkillMatcher, combine_ats_score
+
+matcher = SkillMatcher()
+
+
+def skills(text):
+    return matcher.mask_to_skills(matcher.skill_mask(text))
+
+
+def test_java_does_not_match_inside_javascript():
+    assert skills("Senior JavaScript developer") == ["javascript"]
+    assert skills("Java and JavaScript") == ["java", "javascript"]
+
+
+def test_punctuation_aliases():
+    assert skills("C++, C# and .NET Core") == ["c++", "c#", ".net"]
+    assert skills("C#/.NET") == ["c#", ".net"]
+    assert skills("ASP.NET MVC") == [".net"]
+    assert skills("abc++ and xc#") == []
+
+
+def test_email_and_domains_are_not_skills():
+    assert skills("contact foo@java.com or visit www.python.org") == []
+    assert skills("I know Java.") == ["java"]
+    assert skills("python/django") == ["python", "django"]
+    assert skills("Java.Spring Boot") == ["java", "spring"]
+
+
+def test_version_suffixes():
+    assert skills("Python3, Java8 and TensorFlow2") == ["python", "java", "tensorflow"]
+    assert skills("Python 3.10") == ["python"]
+    assert skills("Python3.10") == ["python"]
+    assert skills("python3x") == []
+
+
+def test_everyday_words_are_not_skills():
+    assert skills("I excel at teamwork and react quickly to change") == []
+    assert skills("Spring 2021 semester, go team") == []
+    assert skills("Spring Boot, ReactJS, MS Excel, golang") == ["go", "react", "spring", "excel"]
+    assert skills("the rag doll holds 500 ml") == []
+    assert skills("built a RAG pipeline as an ML engineer") == ["machine learning", "rag"]
+
+
+def test_overlapping_aliases_via_failure_links():
+    m = SkillMatcher({"bdp": ["big data platform"], "pipe": ["data pipeline"], "ml": ["machine learning"], "lp": ["learning path"]})
+    # "big data p" breaks off at "i"; the failure link must resume inside "data pipeline"
+    assert m.mask_to_skills(m.skill_mask("big data pipeline")) == ["pipe"]
+    # "learning path" starts inside an already matched alias
+    assert m.mask_to_skills(m.skill_mask("machine learning path")) == ["ml", "lp"]
+    assert skills("deep learning and machine learning") == ["machine learning", "deep learning"]
+
+
+def test_empty_jd_has_no_skill_score():
+    index = SkillIndex(["Python developer"], ["a.pdf"])
+    assert index.match("") == [
+        {"filename": "a.pdf", "skill_score": None, "matched_skills": [], "missing_skills": []}
+    ]
+    assert index.match("team player")[0]["skill_score"] is None
+    assert index.search("") == []
+
+
+def test_match_scores_and_search():
+    docs = ["Python Django AWS Docker", "Java Spring Boot Kubernetes Python", "ReactJS frontend"]
+    index = SkillIndex(docs, ["a", "b", "c"])
+    jd = "Python engineer with Docker and Kubernetes on AWS"
+
+    results = {r["filename"]: r for r in index.match(jd)}
+    assert results["a"]["skill_score"] == 75.0
+    assert results["a"]["missing_skills"] == ["kubernetes"]
+    assert results["b"]["skill_score"] == 50.0
+    assert results["b"]["matched_skills"] == ["python", "kubernetes"]
+    assert results["c"]["skill_score"] == 0.0
+
+    assert [r["filename"] for r in index.match(jd, ["b"])] == ["b"]
+
+
+def test_search_ranks_corpus_by_coverage():
+    docs = [
+        "Python Docker",
+        "ReactJS frontend",
+        "Python Docker Kubernetes AWS Terraform",
+        "Python Docker Kubernetes",
+    ]
+    index = SkillIndex(docs, ["a", "b", "c", "d"])
+    jd = "Python, Docker, Kubernetes, AWS and Terraform"
+
+    hits = index.search(jd)
+    assert [(h["filename"], h["skill_score"]) for h in hits] == [("c", 100.0), ("d", 60.0)]
+    assert hits[0]["content"] == docs[2]
+    assert [h["filename"] for h in index.search(jd, top_k=1)] == ["c"]
+    assert [h["filename"] for h in index.search(jd, min_coverage=0)] == ["c", "d", "a"]
+
+
+def test_combine_ats_score_only_blends_with_a_skill_score():
+    assert combine_ats_score(80.0, 50.0) == 68.0
+    assert combine_ats_score(80.0, 0.0) == 48.0
+    assert combine_ats_score(80.0, None) == 80.0
@@ -14,6 +14,7 @@ from app.vectorstore.bm25_handler import BM25Handler
 from app.retriever.hybrid_retriever import HybridRetriever
 from app.llm.perplexity_llm import query_perplexity_llm
 from app.ats_scorer.ats_scorer import compute_ats_score
+from app.ats_scorer.skill_matcher import SkillIndex, combine_ats_score
 
 # Temporary function in case import fails
 def load_uploaded_resumes_temp(uploaded_files):
@@ -49,7 +50,7 @@ st.set_page_config(page_title="Resume Retriever", layout="wide")
 st.title("Resume Retrieval System (BM25 + FAISS Hybrid + Perplexity LLM)")
 
 # 🔄 Session state initialization
-for key in ["texts", "metadata", "embeddings", "bm25", "faiss"]:
+for key in ["texts", "metadata", "embeddings", "bm25", "faiss", "skills"]:
     if key not in st.session_state:
         st.session_state[key] = None
 
@@ -124,6 +125,9 @@ if input_method == "Upload PDF Files":
                     st.info("Initializing FAISS handler...")
                     st.session_state.faiss = FaissHandler(cleaned_texts, metadata)
 
+                    st.info("Extracting skills...")
+                    st.session_state.skills = SkillIndex(cleaned_texts, metadata)
+
                     st.success(f"Successfully processed {len(docs)} resumes!")
                     
                     with st.expander("Processing Summary", expanded=True):
@@ -174,6 +178,7 @@ elif input_method == "Use Folder Path":
                         st.session_state.bm25 = BM25Handler(cleaned_texts, metadata)
                         st.session_state.embeddings = get_embeddings(cleaned_texts)
                         st.session_state.faiss = FaissHandler(cleaned_texts, metadata)
+                        st.session_state.skills = SkillIndex(cleaned_texts, metadata)
 
                         st.success(f"Successfully processed {len(docs)} resumes from folder!")
                         
@@ -210,9 +215,29 @@ if query and st.button("Retrieve Matching Resumes"):
                 )
                 results = hybrid.retrieve(query)
                 
+                # Bring in the best skill-coverage resumes that missed the hybrid top-k
+                if st.session_state.skills is not None:
+                    retrieved = {r["filename"] for r in results}
+                    for hit in st.session_state.skills.search(query):
+                        if hit["filename"] not in retrieved:
+                            results.append({**hit, "score": 0})
+
+                # Keyword skill coverage for the retrieved resumes only
+                skill_matches = {}
+                if st.session_state.skills is not None:
+                    skill_matches = {
+                        m["filename"]: m
+                        for m in st.session_state.skills.match(query, [r["filename"] for r in results])
+                    }
+
                 # Calculate ATS scores
                 for res in results:
-                    res["ats_score"] = compute_ats_score(res["content"], query)
+                    res["semantic_score"] = compute_ats_score(res["content"], query)
+                    match = skill_matches.get(res["filename"])
+                    if match is not None:
+                        res.update(match)
+                    # skill_score is None when the JD names no known skills
+                    res["ats_score"] = combine_ats_score(res["semantic_score"], res.get("skill_score"))
                 
                 # Sort by ATS score
                 results.sort(key=lambda x: x['ats_score'], reverse=True)
@@ -245,6 +270,12 @@ if "results" in st.session_state and st.session_state.results:
                 # Simple progress bar
                 progress = res['ats_score'] / 100
                 st.progress(progress)
+
+            # Skill coverage
+            if res.get("skill_score") is not None:
+                st.markdown(f"**Skill Coverage:** {res['skill_score']}% (semantic match: {res['semantic_score']}%)")
+                st.write("**Matched skills:**", ", ".join(res["matched_skills"]) or "None")
+                st.write("**Missing skills:**", ", ".join(res["missing_skills"]) or "None")
             
             # Resume content
             st.markdown("**Resume Content:**")